@@ -0,0 +1,84 @@
+import asyncio
+import logging
+from typing import List, Optional
+
+from sqlalchemy import insert
+
+from app.database import AsyncSessionLocal
+from app.models import AuditLog
+
+logger = logging.getLogger(__name__)
+
+# Flush whatever has queued every 100ms, or sooner once a batch fills;
+# past this depth callers fall back to a synchronous insert so memory
+# stays bounded even if the flusher stalls
+_FLUSH_INTERVAL = 0.1
+_MAX_BATCH = 500
+_MAX_QUEUE_DEPTH = 10_000
+
+audit_queue: "asyncio.Queue[dict]" = asyncio.Queue()
+_flusher_task: Optional[asyncio.Task] = None
+
+async def record_audit_event(event: dict, db=None) -> None:
+    """Queue an audit event for the background flusher.
+
+    Endpoints enqueue a plain column dict instead of inserting an AuditLog
+    row in their own transaction; batches collapse many events into one
+    multi-row INSERT and one WAL flush. When the queue is saturated and a
+    session is at hand, insert directly instead of growing the backlog.
+    """
+    if audit_queue.qsize() >= _MAX_QUEUE_DEPTH and db is not None:
+        await db.execute(insert(AuditLog), [event])
+        await db.commit()
+        return
+    audit_queue.put_nowait(event)
+
+async def _flush(events: List[dict]) -> None:
+    async with AsyncSessionLocal() as session:
+        await session.execute(insert(AuditLog), events)
+        await session.commit()
+
+async def _audit_flusher() -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await audit_queue.get()]
+        deadline = loop.time() + _FLUSH_INTERVAL
+        while len(batch) < _MAX_BATCH:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(audit_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        try:
+            await _flush(batch)
+        except Exception:
+            # The audit trail must never take request handling down with it
+            logger.exception("Failed to flush %d audit events", len(batch))
+
+def start_audit_flusher() -> None:
+    """Start the background flusher (called from the app lifespan)"""
+    global _flusher_task
+    if _flusher_task is None or _flusher_task.done():
+        _flusher_task = asyncio.create_task(_audit_flusher())
+
+async def stop_audit_flusher() -> None:
+    """Cancel the flusher and write out anything still queued"""
+    global _flusher_task
+    if _flusher_task is not None:
+        _flusher_task.cancel()
+        try:
+            await _flusher_task
+        except asyncio.CancelledError:
+            pass
+        _flusher_task = None
+
+    remaining: List[dict] = []
+    while not audit_queue.empty():
+        remaining.append(audit_queue.get_nowait())
+    if remaining:
+        try:
+            await _flush(remaining)
+        except Exception:
+            logger.exception("Failed to flush %d audit events at shutdown", len(remaining))
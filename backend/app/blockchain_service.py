@@ -1,141 +1,237 @@
-from web3 import Web3
+from web3 import AsyncWeb3, AsyncHTTPProvider
+from web3.exceptions import TransactionNotFound
+from eth_account import Account
 from typing import Dict, List, Optional
+from decimal import Decimal
+import asyncio
 import json
 import os
+import time
 from pathlib import Path
 
+# Simplified Chama contract ABI. In production this would come from a compiled
+# contract; hoisted to module scope (immutable tuple) so it is parsed once
+# rather than rebuilt per BlockchainService instance.
+_CHAMA_ABI = (
+    {
+        "inputs": [
+            {"internalType": "uint256", "name": "_contributionAmount", "type": "uint256"},
+            {"internalType": "address[]", "name": "_initialMembers", "type": "address[]"}
+        ],
+        "stateMutability": "nonpayable",
+        "type": "constructor"
+    },
+    {
+        "inputs": [],
+        "name": "contribute",
+        "outputs": [],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+)
+
 class BlockchainService:
     def __init__(self, provider_url: str, private_key: Optional[str] = None):
-        self.w3 = Web3(Web3.HTTPProvider(provider_url))
+        # AsyncHTTPProvider keeps one aiohttp session alive across calls, so the
+        # service should be instantiated once per process and shared.
+        self.w3 = AsyncWeb3(AsyncHTTPProvider(provider_url, request_kwargs={"timeout": 30}))
         self.private_key = private_key
-        
+        # Derived on first use and cached - the EC scalar multiplication
+        # still happens once, but a placeholder key in a dev .env no
+        # longer blows up at import time
+        self._account = None
+
         # Load contract ABI and bytecode
         self.contract_path = Path(__file__).parent.parent / 'contracts' / 'ChamaContract.sol'
-        self.chama_abi = self._load_chama_abi()
+        self.chama_abi = _CHAMA_ABI
         self.chama_bytecode = self._load_chama_bytecode()
-    
-    def _load_chama_abi(self) -> List:
-        """Load the Chama contract ABI"""
-        # In production, this would load from a compiled contract
-        # For now, we'll use a simplified ABI
-        return [
-            {
-                "inputs": [
-                    {"internalType": "uint256", "name": "_contributionAmount", "type": "uint256"},
-                    {"internalType": "address[]", "name": "_initialMembers", "type": "address[]"}
-                ],
-                "stateMutability": "nonpayable",
-                "type": "constructor"
-            },
-            {
-                "inputs": [],
-                "name": "contribute",
-                "outputs": [],
-                "stateMutability": "payable",
-                "type": "function"
-            }
-        ]
-    
+
+        # Contract objects are pure CPU to build (ABI walk + dispatch tables),
+        # so keep one per address instead of rebuilding on every call
+        self._contracts: Dict[str, object] = {}
+
+        # Deployment factory is address-less and constant; built on first
+        # deploy and reused (building it here would validate the bytecode
+        # at import time, where a bad value takes the whole app down)
+        self._deploy_factory = None
+
+        # chainId never changes for a provider; fetched once on first use
+        self._chain_id: Optional[int] = None
+
+    async def _get_chain_id(self) -> int:
+        """Fetch and cache the provider's chain id"""
+        if self._chain_id is None:
+            self._chain_id = await self.w3.eth.chain_id
+        return self._chain_id
+
+    async def _await_receipt(self, tx_hash, timeout: float = 120):
+        """Poll for a transaction receipt with exponential backoff.
+
+        Unlike wait_for_transaction_receipt's fixed 0.1s polling, this backs
+        off up to 2s between probes, yielding the event loop so many pending
+        transactions can coexist on one worker without hammering the node.
+        """
+        delay = 0.2
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                return await self.w3.eth.get_transaction_receipt(tx_hash)
+            except TransactionNotFound:
+                pass
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Transaction {tx_hash!r} not mined within {timeout}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.5, 2.0)
+
+    def _get_account(self):
+        """Get (or derive and cache) the account for the configured key"""
+        if self._account is None and self.private_key:
+            self._account = Account.from_key(self.private_key)
+        return self._account
+
+    def _get_deploy_factory(self):
+        """Get (or build and cache) the address-less deployment factory"""
+        if self._deploy_factory is None:
+            self._deploy_factory = self.w3.eth.contract(
+                abi=self.chama_abi,
+                bytecode=self.chama_bytecode
+            )
+        return self._deploy_factory
+
+    def _contract_for(self, contract_address: str):
+        """Get (or build and cache) the contract instance for an address"""
+        contract = self._contracts.get(contract_address)
+        if contract is None:
+            contract = self.w3.eth.contract(
+                address=contract_address,
+                abi=self.chama_abi
+            )
+            self._contracts[contract_address] = contract
+        return contract
+
     def _load_chama_bytecode(self) -> str:
         """Load the Chama contract bytecode"""
         # In production, this would load from a compiled contract
         # For now, we'll use a placeholder
         return "0x608060405234801561001057600080fd5b506040516103..."
-    
+
     async def deploy_chama_contract(
-        self, 
-        contribution_amount: float,
+        self,
+        contribution_amount: Decimal,
         member_addresses: List[str]
     ) -> Dict:
         """Deploy a new Chama smart contract"""
-        if not self.private_key:
+        account = self._get_account()
+        if not account:
             raise ValueError("Private key required for contract deployment")
-        
-        account = self.w3.eth.account.from_key(self.private_key)
-        
+
         # Convert contribution amount to Wei
         contribution_wei = self.w3.to_wei(contribution_amount, 'ether')
-        
-        # Create contract instance
-        contract = self.w3.eth.contract(
-            abi=self.chama_abi,
-            bytecode=self.chama_bytecode
+
+        # Built on the first deploy, reused afterwards
+        contract = self._get_deploy_factory()
+
+        # Fetch nonce, gas price and chain id concurrently - one round-trip window
+        nonce, gas_price, chain_id = await asyncio.gather(
+            self.w3.eth.get_transaction_count(account.address),
+            self.w3.eth.gas_price,
+            self._get_chain_id()
         )
-        
-        # Build constructor transaction
-        constructor_txn = contract.constructor(
+
+        # All fields are explicit so build_transaction does no hidden RPCs
+        constructor_txn = await contract.constructor(
             contribution_wei,
             member_addresses
         ).build_transaction({
             'from': account.address,
-            'nonce': self.w3.eth.get_transaction_count(account.address),
+            'nonce': nonce,
             'gas': 2000000,
-            'gasPrice': self.w3.eth.gas_price
+            'gasPrice': gas_price,
+            'chainId': chain_id
         })
-        
+
         # Sign transaction
-        signed_txn = self.w3.eth.account.sign_transaction(
-            constructor_txn, 
-            private_key=self.private_key
-        )
-        
+        signed_txn = account.sign_transaction(constructor_txn)
+
         # Send transaction
-        tx_hash = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
-        
+        tx_hash = await self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
+
         # Wait for transaction receipt
-        tx_receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
-        
+        tx_receipt = await self._await_receipt(tx_hash)
+
+        # bytes.hex() is a single C call; HexBytes.hex() goes through Python
+        tx_hash_hex = '0x' + bytes(tx_receipt.transactionHash).hex()
+
         return {
             'contract_address': tx_receipt.contractAddress,
-            'transaction_hash': tx_receipt.transactionHash.hex(),
+            'transaction_hash': tx_hash_hex,
             'gas_used': tx_receipt.gasUsed
         }
-    
+
     async def contribute_to_group(
         self,
         contract_address: str,
-        amount: float,
+        amount: Decimal,
         member_address: str
     ) -> Dict:
         """Make a contribution to a group"""
-        if not self.private_key:
+        account = self._get_account()
+        if not account:
             raise ValueError("Private key required for contribution")
-        
+
         # Convert amount to Wei
         amount_wei = self.w3.to_wei(amount, 'ether')
-        
-        # Get contract instance
-        contract = self.w3.eth.contract(
-            address=contract_address,
-            abi=self.chama_abi
+
+        # Get contract instance (cached per address)
+        contract = self._contract_for(contract_address)
+
+        # Fetch nonce, gas price and chain id concurrently - one round-trip window
+        nonce, gas_price, chain_id = await asyncio.gather(
+            self.w3.eth.get_transaction_count(member_address),
+            self.w3.eth.gas_price,
+            self._get_chain_id()
         )
-        
-        # Build contribution transaction
-        txn = contract.functions.contribute().build_transaction({
+
+        # All fields are explicit so build_transaction does no hidden RPCs
+        txn = await contract.functions.contribute().build_transaction({
             'from': member_address,
             'value': amount_wei,
-            'nonce': self.w3.eth.get_transaction_count(member_address),
+            'nonce': nonce,
             'gas': 200000,
-            'gasPrice': self.w3.eth.gas_price
+            'gasPrice': gas_price,
+            'chainId': chain_id
         })
-        
+
         # Sign and send transaction
-        signed_txn = self.w3.eth.account.sign_transaction(
-            txn,
-            private_key=self.private_key
-        )
-        tx_hash = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
-        
+        signed_txn = account.sign_transaction(txn)
+        tx_hash = await self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
+
         # Wait for receipt
-        receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
-        
+        receipt = await self._await_receipt(tx_hash)
+
+        # bytes.hex() is a single C call; HexBytes.hex() goes through Python
+        tx_hash_hex = '0x' + bytes(receipt.transactionHash).hex()
+
         return {
-            'transaction_hash': receipt.transactionHash.hex(),
+            'transaction_hash': tx_hash_hex,
             'status': 'success' if receipt.status == 1 else 'failed',
             'gas_used': receipt.gasUsed
         }
-    
-    def get_contract_balance(self, contract_address: str) -> float:
-        """Get the balance of a contract in Ether"""
-        balance_wei = self.w3.eth.get_balance(contract_address)
+
+    async def get_balance(self, address: str) -> Decimal:
+        """Get the balance of an address in Ether"""
+        balance_wei = await self.w3.eth.get_balance(address)
         return self.w3.from_wei(balance_wei, 'ether')
+
+    async def get_balances(self, addresses: List[str]) -> Dict[str, Decimal]:
+        """Get the balances of many addresses concurrently.
+
+        The lookups share the provider's keep-alive session, so N reads
+        overlap in one round-trip window instead of running serially.
+        """
+        balances = await asyncio.gather(*(self.get_balance(address) for address in addresses))
+        return dict(zip(addresses, balances))
+
+    async def get_contract_balance(self, contract_address: str) -> Decimal:
+        """Get the balance of a contract in Ether"""
+        return await self.get_balance(contract_address)
@@ -0,0 +1,70 @@
+import hashlib
+import time
+from typing import Awaitable, Callable, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
+
+class TTLCache:
+    """Small in-process cache with per-entry expiry.
+
+    Single-process by design: each worker keeps its own copy and entries
+    expire within their TTL, which bounds staleness without any external
+    cache infrastructure.
+    """
+
+    def __init__(self):
+        self._entries: dict = {}
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key, value, ttl: float):
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+    def invalidate(self, key=None):
+        """Drop one key, or everything when no key is given"""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+# Shared cache for rendered response bodies (dashboard-style endpoints)
+response_cache = TTLCache()
+
+async def etag_json_response(
+    request: Request,
+    cache_key: str,
+    ttl: float,
+    builder: Callable[[], Awaitable[dict]],
+) -> Response:
+    """Serve a JSON payload with short-TTL caching and ETag revalidation.
+
+    On a cache hit the database work and the serialization are both
+    skipped; when the client's If-None-Match matches, even the body is
+    skipped and a 304 goes out.
+    """
+    cached: Optional[Tuple[bytes, str]] = response_cache.get(cache_key)
+    if cached is None:
+        payload = await builder()
+        # jsonable_encoder first: builders hand back raw aggregates, and
+        # orjson alone cannot encode types like the Decimal sums coming
+        # off Numeric columns. The cost is paid once per TTL window.
+        body = ORJSONResponse(jsonable_encoder(payload)).body
+        etag = 'W/"{}"'.format(hashlib.md5(body).hexdigest())
+        response_cache.set(cache_key, (body, etag), ttl)
+    else:
+        body, etag = cached
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
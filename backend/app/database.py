@@ -1,5 +1,6 @@
 import os
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
@@ -9,12 +10,43 @@ load_dotenv()
 # Database URL - using SQLite for development, PostgreSQL for production
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./chama.db")
 
+def _async_url(url: str) -> str:
+    """Map the configured URL onto its async driver"""
+    if url.startswith("sqlite"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return url
+
 engine = create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
 )
 
+_ASYNC_DATABASE_URL = _async_url(DATABASE_URL)
+
+# Async engine for request handlers - lets the event loop overlap other
+# requests while a query is in flight instead of blocking the worker.
+# query_cache_size keeps the compiled SQL for every hot statement cached
+# in Python; on asyncpg the connect_args also size the per-connection
+# prepared-statement cache so Postgres skips parse/plan on repeats.
+_async_engine_kwargs: dict = {"query_cache_size": 1200}
+if _ASYNC_DATABASE_URL.startswith("postgresql+asyncpg"):
+    _async_engine_kwargs.update(
+        # Sized for a worker fleet: the default 5+10 pool becomes the
+        # serialization point under modest polling traffic. pre_ping and
+        # recycle keep connections honest across network/DB restarts.
+        pool_size=20,
+        max_overflow=30,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        connect_args={"statement_cache_size": 512},
+    )
+
+async_engine = create_async_engine(_ASYNC_DATABASE_URL, **_async_engine_kwargs)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
 Base = declarative_base()
 
 def get_db():
@@ -23,3 +55,7 @@ def get_db():
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as session:
+        yield session
@@ -0,0 +1,44 @@
+"""Domain enumerations shared by the ORM models and the API schemas.
+
+A leaf module with no SQLAlchemy imports: code that only needs the
+vocabularies (schemas, permissions tables, scripts) can import them
+without paying for the declarative model graph at import time.
+"""
+import enum
+
+class UserRole(enum.Enum):
+    ADMIN = "admin"
+    GROUP_MANAGER = "group_manager"
+    TREASURER = "treasurer"
+    MEMBER = "member"
+
+class UserStatus(enum.Enum):
+    ACTIVE = "active"
+    PENDING_VERIFICATION = "pending_verification"
+    SUSPENDED = "suspended"
+    INACTIVE = "inactive"
+
+class GroupStatus(enum.Enum):
+    ACTIVE = "active"
+    SUSPENDED = "suspended"
+    INACTIVE = "inactive"
+
+class MemberStatus(enum.Enum):
+    ACTIVE = "active"
+    INACTIVE = "inactive"
+
+class GroupRole(enum.Enum):
+    ADMIN = "admin"
+    TREASURER = "treasurer"
+    MEMBER = "member"
+
+class CycleStatus(enum.Enum):
+    ACTIVE = "active"
+    COMPLETED = "completed"
+    CANCELLED = "cancelled"
+
+class ContributionStatus(enum.Enum):
+    PENDING = "pending"
+    CONFIRMED = "confirmed"
+    FAILED = "failed"
+    LATE = "late"
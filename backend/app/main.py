@@ -1,16 +1,31 @@
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from app.routers import users, groups, blockchain
+from fastapi.responses import ORJSONResponse
+from app.routers import users, groups, blockchain, admin, notifications
+from app.audit import start_audit_flusher, stop_audit_flusher
 from app.database import engine
 from app.models import Base
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Create database tables on startup (set RUN_CREATE_ALL=0 in production,
+    # where Alembic owns the schema) instead of blocking module import
+    if os.getenv("RUN_CREATE_ALL", "1") != "0":
+        await run_in_threadpool(Base.metadata.create_all, bind=engine)
+    start_audit_flusher()
+    yield
+    await stop_audit_flusher()
 
 app = FastAPI(
     title="Chama API",
     description="Blockchain-powered rotating savings and credit association system",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -26,6 +41,8 @@ app.add_middleware(
 app.include_router(users.router, prefix="/api/users", tags=["users"])
 app.include_router(groups.router, prefix="/api/groups", tags=["groups"])
 app.include_router(blockchain.router, prefix="/api/blockchain", tags=["blockchain"])
+app.include_router(admin.router, prefix="/api/admin", tags=["admin"])
+app.include_router(notifications.router, prefix="/api/notifications", tags=["notifications"])
 
 @app.get("/")
 async def root():
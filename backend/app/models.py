@@ -1,24 +1,85 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Numeric, DateTime, Boolean, ForeignKey, Text, Index, text, Enum, JSON
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
 from app.database import Base
+# Re-exported so existing `from app.models import UserRole` imports keep
+# working; the enums themselves live in the SQLAlchemy-free leaf module
+from app.enums import (
+    ContributionStatus,
+    CycleStatus,
+    GroupRole,
+    GroupStatus,
+    MemberStatus,
+    UserRole,
+    UserStatus,
+)
+
+# Store the lowercase values (not the member names) so existing rows and
+# raw-SQL predicates like status='active' keep working
+def _enum_values(enum_cls):
+    return [member.value for member in enum_cls]
 
 class User(Base):
     __tablename__ = "users"
     
     id = Column(Integer, primary_key=True, index=True)
-    username = Column(String, unique=True, index=True, nullable=False)
-    email = Column(String, unique=True, index=True, nullable=False)
-    wallet_address = Column(String, unique=True, nullable=True, default=None)  # Allow NULL but unique when not NULL
-    hashed_password = Column(String, nullable=False)
-    full_name = Column(String)
-    phone_number = Column(String)
-    is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    
+    username = Column(String(64), unique=True, index=True, nullable=False)
+    email = Column(String(254), unique=True, index=True, nullable=False)
+    wallet_address = Column(String(42), unique=True, nullable=True, default=None)  # 0x + 40 hex chars; allow NULL but unique when not NULL
+    hashed_password = Column(String(128), nullable=False)  # argon2id digests run ~95 chars; bcrypt is 60
+    full_name = Column(String(128))
+    phone_number = Column(String(32))
+    status = Column(Enum(UserStatus, values_callable=_enum_values), default=UserStatus.ACTIVE)
+    # native_enum=False emits VARCHAR(16) + CHECK instead of a named Postgres
+    # type, so adding a role is a constraint swap rather than a blocking
+    # ALTER TYPE migration
+    role = Column(
+        Enum(UserRole, native_enum=False, length=16, values_callable=_enum_values, validate_strings=True),
+        default=UserRole.MEMBER,
+        index=True
+    )
+    # Indexed for the signup-trend and monthly-cohort queries
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    # The database computes both timestamps - no client-side datetime.utcnow()
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    last_login = Column(DateTime(timezone=True))
+
     # Relationships
     group_memberships = relationship("GroupMember", back_populates="user")
     created_groups = relationship("Group", back_populates="creator")
+    # Unbounded collection - force an explicit loader in endpoints that need it
+    notifications = relationship("Notification", back_populates="user", lazy="raise")
+
+    __table_args__ = (
+        # Emails are stored lowercase, and the unique expression index
+        # enforces case-insensitive uniqueness even against raw-SQL writes
+        Index("ix_users_email_lower", func.lower(email), unique=True),
+        # Tiny partial index for the pervasive "active users only" filter
+        Index("ix_users_active", "id", postgresql_where=text("status = 'active'")),
+    )
+
+    @hybrid_property
+    def is_active(self):
+        return self.status == UserStatus.ACTIVE
+
+    @is_active.expression
+    def is_active(cls):
+        return cls.status == UserStatus.ACTIVE
+
+    @validates("email")
+    def _normalize_email(self, key, value):
+        # Store canonical lowercase so equality lookups hit the unique
+        # index regardless of how the user capitalized their address
+        return value.strip().lower() if value else value
+
+    @validates("wallet_address")
+    def _normalize_wallet_address(self, key, value):
+        # Ethereum addresses are case-insensitive (checksum casing is
+        # advisory); store canonical lowercase so the unique index is the
+        # single source of truth for lookups
+        return value.lower() if value else value
 
 class Group(Base):
     __tablename__ = "groups"
@@ -26,19 +87,32 @@ class Group(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
     description = Column(Text)
-    contribution_amount = Column(Float, nullable=False)
+    contribution_amount = Column(Numeric(38, 18), nullable=False)  # 18 decimals matches Wei precision
     contribution_frequency = Column(String, nullable=False)  # weekly, monthly
     max_members = Column(Integer, nullable=False)
     contract_address = Column(String, unique=True)
-    is_active = Column(Boolean, default=True)
+    status = Column(Enum(GroupStatus, values_callable=_enum_values), default=GroupStatus.ACTIVE)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     creator_id = Column(Integer, ForeignKey("users.id"))
-    
+
     # Relationships
     creator = relationship("User", back_populates="created_groups")
-    members = relationship("GroupMember", back_populates="group")
+    members = relationship("GroupMember", back_populates="group", lazy="selectin", passive_deletes=True)
     cycles = relationship("Cycle", back_populates="group")
 
+    __table_args__ = (
+        # Tiny partial index for the pervasive "active groups only" filter
+        Index("ix_groups_active", "id", postgresql_where=text("status = 'active'")),
+    )
+
+    @hybrid_property
+    def is_active(self):
+        return self.status == GroupStatus.ACTIVE
+
+    @is_active.expression
+    def is_active(cls):
+        return cls.status == GroupStatus.ACTIVE
+
 class GroupMember(Base):
     __tablename__ = "group_members"
     
@@ -46,13 +120,39 @@ class GroupMember(Base):
     user_id = Column(Integer, ForeignKey("users.id"))
     group_id = Column(Integer, ForeignKey("groups.id"))
     join_date = Column(DateTime(timezone=True), server_default=func.now())
-    is_active = Column(Boolean, default=True)
+    status = Column(Enum(MemberStatus, values_callable=_enum_values), default=MemberStatus.ACTIVE)
+    role = Column(Enum(GroupRole, values_callable=_enum_values), default=GroupRole.MEMBER)
     rotation_order = Column(Integer)
-    
+
     # Relationships
     user = relationship("User", back_populates="group_memberships")
     group = relationship("Group", back_populates="members")
 
+    __table_args__ = (
+        # Covers the hottest lookup in permission checks: active membership
+        # for one (user, group) pair
+        Index(
+            "ix_group_members_user_group_active",
+            "user_id",
+            "group_id",
+            postgresql_where=text("status = 'active'")
+        ),
+        # Member counts and member listings filter on (group, active)
+        Index(
+            "ix_group_members_group_active",
+            "group_id",
+            postgresql_where=text("status = 'active'")
+        ),
+    )
+
+    @hybrid_property
+    def is_active(self):
+        return self.status == MemberStatus.ACTIVE
+
+    @is_active.expression
+    def is_active(cls):
+        return cls.status == MemberStatus.ACTIVE
+
 class Cycle(Base):
     __tablename__ = "cycles"
     
@@ -62,15 +162,21 @@ class Cycle(Base):
     recipient_id = Column(Integer, ForeignKey("users.id"))
     start_date = Column(DateTime(timezone=True), nullable=False)
     end_date = Column(DateTime(timezone=True), nullable=False)
-    total_amount = Column(Float)
-    payout_amount = Column(Float)  # 90% of total
-    status = Column(String, default="active")  # active, completed, cancelled
+    total_amount = Column(Numeric(38, 18))
+    payout_amount = Column(Numeric(38, 18))  # 90% of total
+    status = Column(Enum(CycleStatus, values_callable=_enum_values), default=CycleStatus.ACTIVE)
     transaction_hash = Column(String)
     
     # Relationships
     group = relationship("Group", back_populates="cycles")
     recipient = relationship("User")
-    contributions = relationship("Contribution", back_populates="cycle")
+    contributions = relationship("Contribution", back_populates="cycle", lazy="selectin")
+
+    __table_args__ = (
+        Index("ix_cycles_group_status", "group_id", "status"),
+        # Partial index keeps the "current active cycle" lookup tiny
+        Index("ix_cycles_group_active", "group_id", postgresql_where=text("status = 'active'")),
+    )
 
 class Contribution(Base):
     __tablename__ = "contributions"
@@ -78,11 +184,79 @@ class Contribution(Base):
     id = Column(Integer, primary_key=True, index=True)
     cycle_id = Column(Integer, ForeignKey("cycles.id"))
     user_id = Column(Integer, ForeignKey("users.id"))
-    amount = Column(Float, nullable=False)
+    amount = Column(Numeric(38, 18), nullable=False)
     transaction_hash = Column(String)
-    contribution_date = Column(DateTime(timezone=True), server_default=func.now())
-    status = Column(String, default="pending")  # pending, confirmed, failed
+    # Indexed for the contribution-trend window queries
+    contribution_date = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    status = Column(Enum(ContributionStatus, values_callable=_enum_values), default=ContributionStatus.PENDING)
     
     # Relationships
     cycle = relationship("Cycle", back_populates="contributions")
     user = relationship("User")
+
+    __table_args__ = (
+        Index("ix_contributions_cycle_status", "cycle_id", "status"),
+        Index("ix_contributions_user_cycle", "user_id", "cycle_id"),
+    )
+
+class Notification(Base):
+    __tablename__ = "notifications"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    title = Column(String(255), nullable=False)
+    message = Column(Text, nullable=False)
+    type = Column(String(50), default="system_alert")
+    is_read = Column(Boolean, default=False, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Relationships
+    user = relationship("User", back_populates="notifications")
+
+    __table_args__ = (
+        # Partial index keeps the unread-badge count and the newest-first
+        # unread listing tiny no matter how large the table grows.
+        # Append-only; monthly RANGE partitioning on created_at is an
+        # ops-level concern once Alembic owns the schema.
+        Index(
+            "ix_notifications_user_unread",
+            "user_id",
+            text("created_at DESC"),
+            postgresql_where=text("is_read = false")
+        ),
+        # Newest-first listings with an unread filter read this index in order
+        Index("ix_notifications_user_read_created", "user_id", "is_read", text("created_at DESC")),
+    )
+
+class AuditLog(Base):
+    __tablename__ = "audit_logs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"))
+    action = Column(String(50), nullable=False)
+    entity_type = Column(String(50), nullable=False)
+    entity_id = Column(Integer)
+    # JSONB on Postgres (binary storage, GIN-indexable, server-side
+    # traversal); plain JSON on the SQLite dev database
+    old_values = Column(JSON().with_variant(JSONB, "postgresql"))
+    new_values = Column(JSON().with_variant(JSONB, "postgresql"))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Relationships
+    user = relationship("User")
+
+    __table_args__ = (
+        Index("ix_audit_entity", "entity_type", "entity_id"),
+        Index("ix_audit_new_values_gin", "new_values", postgresql_using="gin"),
+        # Newest-first log listings read the index in order instead of sorting
+        Index("ix_audit_created_desc", text("created_at DESC")),
+        Index("ix_audit_user_created", "user_id", text("created_at DESC")),
+    )
+
+class SystemSettings(Base):
+    __tablename__ = "system_settings"
+
+    id = Column(Integer, primary_key=True, index=True)
+    key = Column(String(100), unique=True, index=True, nullable=False)
+    value = Column(JSON().with_variant(JSONB, "postgresql"))
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
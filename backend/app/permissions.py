@@ -0,0 +1,349 @@
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+from fastapi import Depends, HTTPException, Request, status
+from sqlalchemy import bindparam, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth import get_current_user
+from app.cache import TTLCache
+from app.database import get_async_db
+from app.models import GroupMember, GroupRole, User, UserRole
+
+# Role sets used on the auth hot path. frozensets are built once at import
+# and give O(1) membership checks instead of rebuilding a list per request.
+_ADMIN = frozenset({UserRole.ADMIN})
+_ADMIN_OR_GROUP_MANAGER = frozenset({UserRole.ADMIN, UserRole.GROUP_MANAGER})
+_ADMIN_OR_TREASURER = frozenset({UserRole.ADMIN, UserRole.TREASURER})
+
+def _denied_detail(roles: Iterable[UserRole]) -> str:
+    return "Access denied. Required roles: {}".format(sorted(r.value for r in roles))
+
+_ADMIN_DETAIL = _denied_detail(_ADMIN)
+_ADMIN_OR_GROUP_MANAGER_DETAIL = _denied_detail(_ADMIN_OR_GROUP_MANAGER)
+_ADMIN_OR_TREASURER_DETAIL = _denied_detail(_ADMIN_OR_TREASURER)
+
+class RoleChecker:
+    """Dependency that allows only the given roles through.
+
+    Instantiate at module scope and reuse: the role set and the denial
+    message are both computed once, and __slots__ keeps each instance to
+    two attribute cells.
+    """
+
+    __slots__ = ("allowed_roles", "_denied")
+
+    def __init__(self, allowed_roles: Iterable[UserRole]):
+        self.allowed_roles = frozenset(allowed_roles)
+        self._denied = _denied_detail(self.allowed_roles)
+
+    def __call__(self, current_user: User = Depends(get_current_user)) -> User:
+        if current_user.role not in self.allowed_roles:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=self._denied
+            )
+        return current_user
+
+# Shared checker instances - use these with Depends() instead of building
+# a new RoleChecker per route
+RequireAdmin = RoleChecker(_ADMIN)
+RequireGroupManagerOrAdmin = RoleChecker(_ADMIN_OR_GROUP_MANAGER)
+RequireTreasurerOrAdmin = RoleChecker(_ADMIN_OR_TREASURER)
+
+def require_admin(current_user: User = Depends(get_current_user)) -> User:
+    """Allow only platform admins through"""
+    if current_user.role not in _ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=_ADMIN_DETAIL
+        )
+    return current_user
+
+def require_group_manager_or_admin(current_user: User = Depends(get_current_user)) -> User:
+    """Allow group managers and admins through"""
+    if current_user.role not in _ADMIN_OR_GROUP_MANAGER:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=_ADMIN_OR_GROUP_MANAGER_DETAIL
+        )
+    return current_user
+
+def require_treasurer_or_admin(current_user: User = Depends(get_current_user)) -> User:
+    """Allow treasurers and admins through"""
+    if current_user.role not in _ADMIN_OR_TREASURER:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=_ADMIN_OR_TREASURER_DETAIL
+        )
+    return current_user
+
+# Group roles that may administer a group or touch its money
+_GROUP_MANAGER_ROLES = frozenset({GroupRole.ADMIN, GroupRole.TREASURER})
+_GROUP_FINANCE_ROLES = frozenset({GroupRole.ADMIN, GroupRole.TREASURER})
+
+# Group membership changes on a minutes-to-hours timescale, so a short
+# in-process cache absorbs the per-request GroupMember lookup that every
+# group-scoped permission check would otherwise issue. Values are wrapped
+# in a 1-tuple so a cached "not a member" (None) is distinguishable from
+# a cache miss. Per-process by design; the TTL bounds staleness.
+_membership_cache = TTLCache()
+_MEMBERSHIP_TTL = 600.0
+
+# Every membership check shares these two prebuilt statements: the
+# expression tree is constructed once at import and SQLAlchemy's compiled
+# cache keys on the statement object, so per-request work is just binding
+# the two parameters. Only the role column is projected - no ORM hydration.
+_MEMBERSHIP_ROLE_STMT = select(GroupMember.role).where(
+    GroupMember.user_id == bindparam("uid"),
+    GroupMember.group_id == bindparam("gid"),
+    GroupMember.is_active == True
+)
+
+# EXISTS lets the database stop at the first matching row when only a
+# boolean answer is needed
+_MEMBERSHIP_EXISTS_STMT = select(
+    select(literal(1)).where(
+        GroupMember.user_id == bindparam("uid"),
+        GroupMember.group_id == bindparam("gid"),
+        GroupMember.is_active == True
+    ).exists()
+)
+
+async def get_membership(user_id: int, group_id: int, db: AsyncSession) -> Optional[GroupRole]:
+    """Get the user's active role in a group, or None when not a member"""
+    key = (user_id, group_id)
+    cached = _membership_cache.get(key)
+    if cached is not None:
+        return cached[0]
+
+    role = await db.scalar(_MEMBERSHIP_ROLE_STMT, {"uid": user_id, "gid": group_id})
+    _membership_cache.set(key, (role,), _MEMBERSHIP_TTL)
+    return role
+
+async def is_active_member(user_id: int, group_id: int, db: AsyncSession) -> bool:
+    """Uncached boolean membership check via EXISTS.
+
+    For callers that need a point-in-time answer rather than the cached
+    role - the database short-circuits on the first matching row.
+    """
+    return bool(await db.scalar(_MEMBERSHIP_EXISTS_STMT, {"uid": user_id, "gid": group_id}))
+
+def invalidate_membership(user_id: int, group_id: int):
+    """Drop the cached membership after a join/leave/role change"""
+    _membership_cache.invalidate((user_id, group_id))
+
+class GroupPermissionChecker:
+    """Group-scoped permission checks backed by the membership cache.
+
+    Platform admins short-circuit before any cache or database hit.
+    """
+
+    @staticmethod
+    async def can_view_group(user: User, group_id: int, db: AsyncSession) -> bool:
+        if user.role == UserRole.ADMIN:
+            return True
+        return await get_membership(user.id, group_id, db) is not None
+
+    @staticmethod
+    async def can_manage_group(user: User, group_id: int, db: AsyncSession) -> bool:
+        if user.role == UserRole.ADMIN:
+            return True
+        return await get_membership(user.id, group_id, db) in _GROUP_MANAGER_ROLES
+
+    @staticmethod
+    async def can_manage_finances(user: User, group_id: int, db: AsyncSession) -> bool:
+        if user.role == UserRole.ADMIN:
+            return True
+        return await get_membership(user.id, group_id, db) in _GROUP_FINANCE_ROLES
+
+async def can_manage_groups_bulk(
+    user: User, group_ids: Sequence[int], db: AsyncSession
+) -> Dict[int, bool]:
+    """Evaluate the manage permission for many groups in one query.
+
+    List endpoints need a per-row flag; answering each group separately
+    would issue one membership lookup per row. A single IN query fetches
+    every relevant (group_id, role) pair and the flags are computed in
+    Python.
+    """
+    if not group_ids:
+        return {}
+    if user.role == UserRole.ADMIN:
+        return {group_id: True for group_id in group_ids}
+
+    rows = (await db.execute(
+        select(GroupMember.group_id, GroupMember.role).where(
+            GroupMember.user_id == user.id,
+            GroupMember.group_id.in_(group_ids),
+            GroupMember.is_active == True
+        )
+    )).all()
+    membership_map = dict(rows)
+    return {
+        group_id: membership_map.get(group_id) in _GROUP_MANAGER_ROLES
+        for group_id in group_ids
+    }
+
+async def get_request_membership(
+    group_id: int,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+) -> Optional[GroupRole]:
+    """Membership for the current request, fetched at most once.
+
+    Declared as its own sub-dependency so FastAPI's solved-dependency cache
+    dedupes it when several permission checkers run on one request; the
+    request.state map covers lookups made outside Depends(). Platform admins
+    are memoized as group admins without touching the cache or the database.
+    """
+    memberships = getattr(request.state, "memberships", None)
+    if memberships is None:
+        memberships = {}
+        request.state.memberships = memberships
+
+    if group_id not in memberships:
+        if current_user.role == UserRole.ADMIN:
+            memberships[group_id] = GroupRole.ADMIN
+        else:
+            memberships[group_id] = await get_membership(current_user.id, group_id, db)
+    return memberships[group_id]
+
+_PERMISSION_ROLE_SETS = {
+    "view": frozenset(GroupRole),
+    "manage": _GROUP_MANAGER_ROLES,
+    "finance": _GROUP_FINANCE_ROLES,
+}
+
+def check_group_permission(permission: str):
+    """Build a dependency enforcing a group-scoped permission.
+
+    All checkers on one request share a single membership fetch through
+    get_request_membership.
+    """
+    allowed = _PERMISSION_ROLE_SETS[permission]
+    denied = "Access denied. Required group permission: {}".format(permission)
+
+    async def permission_checker(
+        current_user: User = Depends(get_current_user),
+        membership: Optional[GroupRole] = Depends(get_request_membership)
+    ) -> User:
+        if membership not in allowed:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=denied
+            )
+        return current_user
+
+    return permission_checker
+
+# Role-based dashboard configuration. The role set is tiny and the config is
+# static, so each function is memoized with lru_cache and warmed at import -
+# dashboard loads become O(1) dict lookups instead of rebuilding hundreds of
+# small objects per request. Results are wrapped in MappingProxyType/tuples so
+# callers cannot mutate the shared cached objects; dict()-copy at the call
+# site if mutation is ever needed.
+
+@lru_cache(maxsize=None)
+def get_user_permissions(role: UserRole) -> Mapping[str, bool]:
+    """Get the permission flags for a role"""
+    permissions = {
+        "view_dashboard": True,
+        "view_groups": True,
+        "join_group": True,
+        "make_contribution": True,
+        "manage_group": False,
+        "manage_members": False,
+        "start_cycle": False,
+        "manage_finances": False,
+        "approve_contributions": False,
+        "view_financial_reports": False,
+        "manage_users": False,
+        "view_audit_logs": False,
+        "manage_system_settings": False,
+        "broadcast_notifications": False,
+    }
+
+    if role in (UserRole.TREASURER, UserRole.ADMIN):
+        permissions.update(
+            manage_finances=True,
+            approve_contributions=True,
+            view_financial_reports=True,
+        )
+
+    if role in (UserRole.GROUP_MANAGER, UserRole.ADMIN):
+        permissions.update(
+            manage_group=True,
+            manage_members=True,
+            start_cycle=True,
+        )
+
+    if role == UserRole.ADMIN:
+        permissions.update(
+            manage_users=True,
+            view_audit_logs=True,
+            manage_system_settings=True,
+            broadcast_notifications=True,
+        )
+
+    return MappingProxyType(permissions)
+
+@lru_cache(maxsize=None)
+def get_navigation_menu(role: UserRole) -> Tuple[Mapping[str, str], ...]:
+    """Get the navigation menu entries for a role"""
+    menu = [
+        {"name": "Dashboard", "path": "/dashboard", "icon": "home"},
+        {"name": "My Groups", "path": "/groups", "icon": "users"},
+        {"name": "Contributions", "path": "/contributions", "icon": "wallet"},
+    ]
+
+    if role in (UserRole.TREASURER, UserRole.ADMIN):
+        menu.append({"name": "Finances", "path": "/finances", "icon": "chart-bar"})
+
+    if role in (UserRole.GROUP_MANAGER, UserRole.ADMIN):
+        menu.append({"name": "Manage Groups", "path": "/groups/manage", "icon": "cog"})
+
+    if role == UserRole.ADMIN:
+        menu.append({"name": "Admin", "path": "/admin", "icon": "shield"})
+
+    return tuple(MappingProxyType(item) for item in menu)
+
+@lru_cache(maxsize=None)
+def get_dashboard_widgets(role: UserRole) -> Tuple[str, ...]:
+    """Get the dashboard widget set for a role"""
+    widgets = ["my_groups", "next_contribution", "recent_activity"]
+
+    if role in (UserRole.TREASURER, UserRole.ADMIN):
+        widgets.extend(["group_balances", "pending_contributions"])
+
+    if role in (UserRole.GROUP_MANAGER, UserRole.ADMIN):
+        widgets.extend(["member_overview", "cycle_progress"])
+
+    if role == UserRole.ADMIN:
+        widgets.extend(["platform_stats", "system_health"])
+
+    return tuple(widgets)
+
+@lru_cache(maxsize=None)
+def get_user_dashboard_config(role: UserRole) -> Mapping[str, object]:
+    """Get the full dashboard configuration for a role"""
+    return MappingProxyType({
+        "permissions": get_user_permissions(role),
+        "navigation": get_navigation_menu(role),
+        "widgets": get_dashboard_widgets(role),
+    })
+
+class DashboardPermissions:
+    """Namespace over the cached per-role dashboard configuration"""
+
+    get_user_permissions = staticmethod(get_user_permissions)
+    get_navigation_menu = staticmethod(get_navigation_menu)
+    get_dashboard_widgets = staticmethod(get_dashboard_widgets)
+    get_user_dashboard_config = staticmethod(get_user_dashboard_config)
+
+# Warm the caches at import so the first dashboard request pays nothing
+for _role in UserRole:
+    get_user_dashboard_config(_role)
+del _role
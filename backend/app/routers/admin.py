@@ -0,0 +1,376 @@
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import ORJSONResponse
+from typing import Optional
+from sqlalchemy import and_, case, desc, func, insert, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload, load_only
+from app.audit import record_audit_event
+from app.cache import TTLCache, etag_json_response
+from app.database import async_engine, get_async_db
+from app.models import User, UserStatus, UserRole, Group, Contribution, AuditLog, Notification, SystemSettings
+from app.permissions import require_admin
+from app.schemas import BroadcastNotificationRequest, SystemSettingUpdate
+
+# Admin payloads are dict-shaped (no response models), so orjson encodes
+# native types directly without a per-field jsonable_encoder pass
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Rows inserted per statement when fanning a broadcast out
+_BROADCAST_BATCH = 1000
+
+def _month_starts(now: datetime):
+    """Start of the current and previous calendar month"""
+    current_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    if current_month.month == 1:
+        last_month = current_month.replace(year=current_month.year - 1, month=12)
+    else:
+        last_month = current_month.replace(month=current_month.month - 1)
+    return current_month, last_month
+
+@router.get("/dashboard")
+async def get_admin_dashboard(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_admin)
+):
+    """Get platform-wide statistics for the admin dashboard"""
+    # Polled heavily by dashboards; short TTL + ETag keeps repeat loads off
+    # the database entirely (and off the wire on If-None-Match)
+    return await etag_json_response(
+        request, "admin:dashboard", ttl=10, builder=lambda: _build_dashboard(db)
+    )
+
+async def _build_dashboard(db: AsyncSession) -> dict:
+    current_month, last_month = _month_starts(datetime.utcnow())
+
+    # One round-trip for all user statistics instead of one COUNT per metric
+    user_stats = (await db.execute(select(
+        func.count(User.id).label("total_users"),
+        func.count(case((User.status == UserStatus.PENDING_VERIFICATION, 1))).label("pending_verifications"),
+        func.count(case((User.created_at >= current_month, 1))).label("current_month_users"),
+        func.count(case((and_(User.created_at >= last_month, User.created_at < current_month), 1))).label("last_month_users"),
+    ))).one()
+
+    # Groups and contributions each collapse to a single aggregate row
+    active_groups = await db.scalar(
+        select(func.count(Group.id)).where(Group.is_active == True)
+    )
+    total_contributions = await db.scalar(
+        select(func.coalesce(func.sum(Contribution.amount), 0))
+    )
+
+    recent_activity = (await db.execute(
+        select(AuditLog).options(
+            selectinload(AuditLog.user).load_only(User.full_name)
+        ).order_by(desc(AuditLog.created_at)).limit(10)
+    )).scalars().all()
+
+    return {
+        "total_users": user_stats.total_users,
+        "pending_verifications": user_stats.pending_verifications,
+        "current_month_users": user_stats.current_month_users,
+        "last_month_users": user_stats.last_month_users,
+        "active_groups": active_groups,
+        "total_contributions": total_contributions,
+        "recent_activity": [_audit_log_dict(log) for log in recent_activity],
+    }
+
+def _audit_log_dict(log: AuditLog) -> dict:
+    return {
+        "id": log.id,
+        "user_id": log.user_id,
+        "user_name": log.user.full_name if log.user else None,
+        "action": log.action,
+        "entity_type": log.entity_type,
+        "entity_id": log.entity_id,
+        "old_values": log.old_values,
+        "new_values": log.new_values,
+        "created_at": log.created_at,
+    }
+
+def _month_bucket(column):
+    """Month-truncation expression for the active dialect ('YYYY-MM')"""
+    if async_engine.dialect.name == "postgresql":
+        return func.to_char(func.date_trunc("month", column), "YYYY-MM")
+    return func.strftime("%Y-%m", column)
+
+@router.get("/analytics")
+async def get_admin_analytics(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_admin)
+):
+    """Get monthly signup, group and contribution trends (last 24 months)"""
+    return await etag_json_response(
+        request, "admin:analytics", ttl=30, builder=lambda: _build_analytics(db)
+    )
+
+async def _build_analytics(db: AsyncSession) -> dict:
+    current_month, _ = _month_starts(datetime.utcnow())
+    # Bound the scan to the charted window instead of all history
+    year, month = current_month.year, current_month.month - 23
+    while month < 1:
+        year, month = year - 1, month + 12
+    window_start = current_month.replace(year=year, month=month)
+
+    # All three monthly series share the time axis, so UNION ALL them into
+    # one round-trip instead of three full-table group-bys
+    users_q = select(
+        _month_bucket(User.created_at).label("month"),
+        literal("users").label("kind"),
+        func.count(User.id).label("value"),
+    ).where(User.created_at >= window_start).group_by("month")
+
+    groups_q = select(
+        _month_bucket(Group.created_at).label("month"),
+        literal("groups").label("kind"),
+        func.count(Group.id).label("value"),
+    ).where(Group.created_at >= window_start).group_by("month")
+
+    contributions_q = select(
+        _month_bucket(Contribution.contribution_date).label("month"),
+        literal("contributions").label("kind"),
+        func.coalesce(func.sum(Contribution.amount), 0).label("value"),
+    ).where(Contribution.contribution_date >= window_start).group_by("month")
+
+    rows = (await db.execute(union_all(users_q, groups_q, contributions_q))).all()
+
+    trends: dict = {}
+    for month_key, kind, value in rows:
+        trends.setdefault(month_key, {"users": 0, "groups": 0, "contributions": 0})[kind] = value
+
+    return {
+        "window_start": window_start,
+        "monthly_trends": [
+            {"month": month_key, **values} for month_key, values in sorted(trends.items())
+        ],
+    }
+
+@router.get("/system-health")
+async def get_system_health(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_admin)
+):
+    """Basic liveness information about the platform"""
+    return await etag_json_response(
+        request, "admin:system-health", ttl=10, builder=lambda: _build_system_health(db)
+    )
+
+async def _build_system_health(db: AsyncSession) -> dict:
+    try:
+        await db.execute(select(literal(1)))
+        database = "healthy"
+    except Exception:
+        database = "unreachable"
+
+    return {
+        "status": "healthy" if database == "healthy" else "degraded",
+        "database": database,
+        "checked_at": datetime.utcnow(),
+    }
+
+@router.get("/audit-logs")
+async def get_audit_logs(
+    skip: int = 0,
+    limit: int = 100,
+    action: Optional[str] = None,
+    entity_type: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_admin)
+):
+    """Get paginated audit logs"""
+    # The window count rides along in the page query, so the filter predicate
+    # is evaluated once instead of re-running as a separate SELECT COUNT(*)
+    stmt = select(AuditLog, func.count().over().label("total")).options(
+        # One IN query for all acting users instead of a lazy load per row
+        selectinload(AuditLog.user).load_only(User.full_name)
+    )
+
+    if action:
+        stmt = stmt.where(AuditLog.action == action)
+    if entity_type:
+        stmt = stmt.where(AuditLog.entity_type == entity_type)
+
+    rows = (await db.execute(
+        stmt.order_by(desc(AuditLog.created_at)).offset(skip).limit(limit)
+    )).all()
+    total = rows[0].total if rows else 0
+
+    return {
+        "total": total,
+        "logs": [_audit_log_dict(row[0]) for row in rows],
+    }
+
+@router.post("/notifications/broadcast")
+async def broadcast_notification(
+    notification_data: BroadcastNotificationRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_admin)
+):
+    """Send a notification to all active users, optionally one role only"""
+    # Only the ids leave the database - no ORM User objects are hydrated
+    stmt = select(User.id).where(User.status == UserStatus.ACTIVE)
+    if notification_data.target == "role":
+        try:
+            stmt = stmt.where(User.role == UserRole(notification_data.target_role))
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Unknown target role"
+            )
+
+    payload = {
+        "title": notification_data.title,
+        "message": notification_data.message,
+        "type": notification_data.type,
+    }
+
+    # Stream the ids and insert in fixed-size batches so a platform-wide
+    # broadcast never materializes every recipient row in memory; each
+    # batch is one multi-row INSERT via executemany
+    recipients = 0
+    batch: list = []
+    result = await db.stream_scalars(stmt.execution_options(yield_per=_BROADCAST_BATCH))
+    async for user_id in result:
+        batch.append({"user_id": user_id, **payload})
+        if len(batch) >= _BROADCAST_BATCH:
+            await db.execute(insert(Notification), batch)
+            recipients += len(batch)
+            batch = []
+    if batch:
+        await db.execute(insert(Notification), batch)
+        recipients += len(batch)
+
+    if recipients:
+        await db.commit()
+
+    return {"message": "Notification broadcast", "recipients": recipients}
+
+@router.get("/users/stats")
+async def get_user_stats(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_admin)
+):
+    """Get per-status and per-role user counts"""
+    # One scan with conditional aggregation instead of one COUNT query per
+    # bucket; count(case(...)) compiles to FILTER-style counting everywhere
+    row = (await db.execute(select(
+        func.count(User.id).label("total"),
+        func.count(case((User.status == UserStatus.ACTIVE, 1))).label("active"),
+        func.count(case((User.status == UserStatus.PENDING_VERIFICATION, 1))).label("pending_verification"),
+        func.count(case((User.status == UserStatus.SUSPENDED, 1))).label("suspended"),
+        func.count(case((User.status == UserStatus.INACTIVE, 1))).label("inactive"),
+        func.count(case((User.role == UserRole.ADMIN, 1))).label("admins"),
+        func.count(case((User.role == UserRole.GROUP_MANAGER, 1))).label("group_managers"),
+        func.count(case((User.role == UserRole.TREASURER, 1))).label("treasurers"),
+        func.count(case((User.role == UserRole.MEMBER, 1))).label("members"),
+        func.count(case((User.wallet_address.isnot(None), 1))).label("wallet_linked"),
+    ))).one()
+
+    return dict(row._mapping)
+
+# Settings change on a minutes-to-days timescale but the endpoint can be
+# polled; the TTL is a safety net for other workers, and the writer drops
+# its own copy immediately on update
+_settings_cache = TTLCache()
+_SETTINGS_KEY = "settings"
+_SETTINGS_TTL = 60.0
+
+@router.get("/system-settings")
+async def get_system_settings(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_admin)
+):
+    """Get all system settings as a key/value map"""
+    settings = _settings_cache.get(_SETTINGS_KEY)
+    if settings is None:
+        rows = (await db.execute(
+            select(SystemSettings.key, SystemSettings.value)
+        )).all()
+        settings = dict(rows)
+        _settings_cache.set(_SETTINGS_KEY, settings, _SETTINGS_TTL)
+    return settings
+
+@router.put("/system-settings/{key}")
+async def update_system_setting(
+    key: str,
+    setting_data: SystemSettingUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_admin)
+):
+    """Create or update one system setting"""
+    setting = await db.scalar(
+        select(SystemSettings).where(SystemSettings.key == key)
+    )
+    if setting is None:
+        setting = SystemSettings(key=key)
+        db.add(setting)
+    setting.value = setting_data.value
+    await db.commit()
+
+    _settings_cache.invalidate(_SETTINGS_KEY)
+    return {"message": "Setting updated successfully", "key": key}
+
+@router.put("/users/{user_id}/role")
+async def update_user_role(
+    user_id: int,
+    role: UserRole,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_admin)
+):
+    """Change a user's platform role"""
+    user = await db.get(User, user_id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+
+    old_role = user.role
+    user.role = role
+    await db.commit()
+
+    # Audit rows ride the background batcher - the admin mutation commits
+    # alone instead of paying for a second INSERT in its transaction
+    await record_audit_event({
+        "user_id": current_user.id,
+        "action": "update_role",
+        "entity_type": "user",
+        "entity_id": user.id,
+        "old_values": {"role": old_role.value if old_role else None},
+        "new_values": {"role": role.value},
+    }, db=db)
+
+    return {"message": "User role updated successfully"}
+
+@router.put("/users/{user_id}/status")
+async def update_user_status(
+    user_id: int,
+    user_status: UserStatus,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_admin)
+):
+    """Change a user's account status"""
+    user = await db.get(User, user_id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+
+    old_status = user.status
+    user.status = user_status
+    await db.commit()
+
+    await record_audit_event({
+        "user_id": current_user.id,
+        "action": "update_status",
+        "entity_type": "user",
+        "entity_id": user.id,
+        "old_values": {"status": old_status.value if old_status else None},
+        "new_values": {"status": user_status.value},
+    }, db=db)
+
+    return {"message": "User status updated successfully"}
@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from app.database import get_db
+from app.database import get_async_db
 from app.models import Group, User, Cycle, Contribution
 from app.schemas import ContractDeployRequest, ContractDeployResponse, TransactionRequest, TransactionResponse
 from app.auth import get_current_user
@@ -19,16 +20,17 @@ blockchain_service = BlockchainService(
 @router.post("/deploy-contract", response_model=ContractDeployResponse)
 async def deploy_group_contract(
     deploy_request: ContractDeployRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Deploy a smart contract for a group"""
     # Verify user owns the group
-    group = db.query(Group).filter(
+    group = await db.scalar(select(Group).where(
         Group.id == deploy_request.group_id,
         Group.creator_id == current_user.id
-    ).first()
-    
+    ))
+
+
     if not group:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -42,15 +44,16 @@ async def deploy_group_contract(
         )
     
     try:
-        # Deploy contract
+        # Deploy contract - the Numeric column already yields a Decimal, so the
+        # amount reaches to_wei without a lossy float round-trip
         result = await blockchain_service.deploy_chama_contract(
-            contribution_amount=deploy_request.contribution_amount,
+            contribution_amount=group.contribution_amount,
             member_addresses=deploy_request.member_addresses
         )
         
         # Update group with contract address
         group.contract_address = result["contract_address"]
-        db.commit()
+        await db.commit()
         
         return ContractDeployResponse(
             contract_address=result["contract_address"],
@@ -67,7 +70,7 @@ async def deploy_group_contract(
 @router.post("/contribute")
 async def make_contribution(
     transaction_request: TransactionRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Make a contribution to the current cycle"""
@@ -93,10 +96,11 @@ async def make_contribution(
         )
 
 @router.get("/group/{group_id}/contract-info")
-async def get_contract_info(group_id: int, db: Session = Depends(get_db)):
+async def get_contract_info(group_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get smart contract information for a group"""
-    group = db.query(Group).filter(Group.id == group_id).first()
-    
+    group = await db.get(Group, group_id)
+
+
     if not group:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -123,12 +127,13 @@ async def get_contract_info(group_id: int, db: Session = Depends(get_db)):
 async def distribute_funds(
     group_id: int,
     recipient_address: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Distribute funds to the current cycle recipient"""
-    group = db.query(Group).filter(Group.id == group_id).first()
-    
+    group = await db.get(Group, group_id)
+
+
     if not group:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -184,3 +189,16 @@ async def get_wallet_balance(address: str):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get balance: {str(e)}"
         )
+
+@router.post("/balance/bulk")
+async def get_wallet_balances(addresses: List[str]):
+    """Get the balances of many wallet addresses in one request"""
+    try:
+        balances = await blockchain_service.get_balances(addresses)
+        return {"balances": balances}
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get balances: {str(e)}"
+        )
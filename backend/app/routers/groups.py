@@ -1,17 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import and_, case, exists, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
 from typing import List
-from app.database import get_db
-from app.models import Group, GroupMember, User
-from app.schemas import GroupCreate, GroupResponse, GroupMemberResponse
+from app.database import get_async_db
+from app.models import Group, GroupMember, GroupRole, MemberStatus, User
+from app.schemas import GroupCreate, GroupResponse, GroupResponseList, GroupMemberResponseList
 from app.auth import get_current_user
+from app.permissions import invalidate_membership
 
 router = APIRouter()
 
 @router.post("/", response_model=GroupResponse)
 async def create_group(
-    group: GroupCreate, 
-    db: Session = Depends(get_db),
+    group: GroupCreate,
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Create a new chama group"""
@@ -23,169 +26,209 @@ async def create_group(
         max_members=group.max_members,
         creator_id=current_user.id
     )
-    
+
     db.add(db_group)
-    db.commit()
-    db.refresh(db_group)
-    
-    # Add creator as first member
+    await db.flush()
+
+    # Add creator as first member - same transaction as the group itself
     db_member = GroupMember(
         user_id=current_user.id,
         group_id=db_group.id,
+        role=GroupRole.ADMIN,
         rotation_order=1
     )
     db.add(db_member)
-    db.commit()
-    
-    return GroupResponse.from_orm(db_group)
+    await db.commit()
+    await db.refresh(db_group)
 
-@router.get("/", response_model=List[GroupResponse])
+    return GroupResponse.model_validate(db_group)
+
+@router.get("/")
 async def get_groups(
-    skip: int = 0, 
-    limit: int = 100, 
-    db: Session = Depends(get_db)
+    skip: int = 0,
+    limit: int = 100,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get list of all groups"""
-    groups = db.query(Group).filter(Group.is_active == True).offset(skip).limit(limit).all()
-    
-    # Add member count to each group
-    result = []
-    for group in groups:
-        group_dict = GroupResponse.from_orm(group).dict()
-        member_count = db.query(GroupMember).filter(
-            GroupMember.group_id == group.id,
-            GroupMember.is_active == True
-        ).count()
-        group_dict["member_count"] = member_count
-        result.append(GroupResponse(**group_dict))
-    
-    return result
+    # One aggregate query for the page instead of one COUNT per group
+    rows = (await db.execute(
+        select(
+            Group, func.count(GroupMember.id).label("member_count")
+        ).outerjoin(
+            GroupMember,
+            and_(GroupMember.group_id == Group.id, GroupMember.is_active == True)
+        ).where(Group.is_active == True).group_by(Group.id).offset(skip).limit(limit)
+    )).all()
+
+    # Validate once, then dump_json emits the UTF-8 body in a single
+    # pydantic-core pass - no intermediate dicts, no second encoder
+    groups = [
+        GroupResponse.model_validate(group).model_copy(update={"member_count": member_count})
+        for group, member_count in rows
+    ]
+    return Response(content=GroupResponseList.dump_json(groups), media_type="application/json")
 
 @router.get("/{group_id}", response_model=GroupResponse)
-async def get_group(group_id: int, db: Session = Depends(get_db)):
+async def get_group(group_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get group by ID"""
-    group = db.query(Group).filter(Group.id == group_id).first()
-    if not group:
+    # Fetch the group and its member count in one query
+    row = (await db.execute(
+        select(
+            Group, func.count(GroupMember.id)
+        ).outerjoin(
+            GroupMember,
+            and_(GroupMember.group_id == Group.id, GroupMember.is_active == True)
+        ).where(Group.id == group_id).group_by(Group.id)
+    )).first()
+
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Group not found"
         )
-    
-    # Add member count
-    group_dict = GroupResponse.from_orm(group).dict()
-    member_count = db.query(GroupMember).filter(
-        GroupMember.group_id == group.id,
-        GroupMember.is_active == True
-    ).count()
-    group_dict["member_count"] = member_count
-    
-    return GroupResponse(**group_dict)
+
+    group, member_count = row
+    return GroupResponse.model_validate(group).model_copy(update={"member_count": member_count})
 
 @router.post("/{group_id}/join")
 async def join_group(
     group_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Join a group"""
-    # Check if group exists
-    group = db.query(Group).filter(Group.id == group_id, Group.is_active == True).first()
+    # Lock the group row so two concurrent joins can't both pass the
+    # capacity check; the lock is released at commit/rollback
+    group = await db.scalar(
+        select(Group).where(
+            Group.id == group_id, Group.is_active == True
+        ).with_for_update()
+    )
     if not group:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Group not found"
         )
-    
-    # Check if user is already a member
-    existing_member = db.query(GroupMember).filter(
-        GroupMember.user_id == current_user.id,
-        GroupMember.group_id == group_id,
-        GroupMember.is_active == True
-    ).first()
-    
-    if existing_member:
+
+    # Existence and capacity in one aggregate query
+    member_count, already_member = (await db.execute(
+        select(
+            func.count(GroupMember.id),
+            func.count(case((GroupMember.user_id == current_user.id, 1)))
+        ).where(
+            GroupMember.group_id == group_id,
+            GroupMember.is_active == True
+        )
+    )).one()
+
+    if already_member:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User is already a member of this group"
         )
-    
-    # Check if group is full
-    current_members = db.query(GroupMember).filter(
-        GroupMember.group_id == group_id,
-        GroupMember.is_active == True
-    ).count()
-    
-    if current_members >= group.max_members:
+
+    if member_count >= group.max_members:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Group is full"
         )
-    
-    # Add user to group
-    db_member = GroupMember(
-        user_id=current_user.id,
-        group_id=group_id,
-        rotation_order=current_members + 1
+
+    # The next rotation slot is computed server-side inside the locked
+    # transaction, so the INSERT stays correct under concurrency without
+    # another round-trip
+    next_order = select(
+        func.coalesce(func.max(GroupMember.rotation_order), 0) + 1
+    ).where(
+        GroupMember.group_id == group_id,
+        GroupMember.is_active == True
+    ).scalar_subquery()
+
+    await db.execute(
+        insert(GroupMember).values(
+            user_id=current_user.id,
+            group_id=group_id,
+            rotation_order=next_order
+        )
     )
-    
-    db.add(db_member)
-    db.commit()
-    
+    await db.commit()
+    invalidate_membership(current_user.id, group_id)
+
     return {"message": "Successfully joined the group"}
 
-@router.get("/{group_id}/members", response_model=List[GroupMemberResponse])
-async def get_group_members(group_id: int, db: Session = Depends(get_db)):
+@router.get("/{group_id}/members")
+async def get_group_members(group_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get all members of a group"""
-    group = db.query(Group).filter(Group.id == group_id).first()
+    group = await db.get(Group, group_id)
     if not group:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Group not found"
         )
-    
-    members = db.query(GroupMember).filter(
-        GroupMember.group_id == group_id,
-        GroupMember.is_active == True
-    ).order_by(GroupMember.rotation_order).all()
-    
-    return [GroupMemberResponse.from_orm(member) for member in members]
+
+    # One IN query loads every member's user, restricted to the columns
+    # UserResponseBrief serializes; raiseload turns any other accidental
+    # lazy access into an error instead of a hidden N+1
+    members = (await db.scalars(
+        select(GroupMember).options(
+            selectinload(GroupMember.user).load_only(
+                User.id, User.username, User.full_name
+            ),
+            raiseload("*")
+        ).where(
+            GroupMember.group_id == group_id,
+            GroupMember.is_active == True
+        ).order_by(GroupMember.rotation_order)
+    )).all()
+    
+    return Response(
+        content=GroupMemberResponseList.dump_json(
+            GroupMemberResponseList.validate_python(members)
+        ),
+        media_type="application/json",
+    )
 
 @router.delete("/{group_id}/leave")
 async def leave_group(
     group_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Leave a group"""
-    member = db.query(GroupMember).filter(
-        GroupMember.user_id == current_user.id,
-        GroupMember.group_id == group_id,
-        GroupMember.is_active == True
-    ).first()
-    
+    member = await db.scalar(
+        select(GroupMember).where(
+            GroupMember.user_id == current_user.id,
+            GroupMember.group_id == group_id,
+            GroupMember.is_active == True
+        )
+    )
+
     if not member:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User is not a member of this group"
         )
-    
+
     # Check if user is the creator and there are other members
-    group = db.query(Group).filter(Group.id == group_id).first()
+    group = await db.get(Group, group_id)
     if group.creator_id == current_user.id:
-        other_members = db.query(GroupMember).filter(
-            GroupMember.group_id == group_id,
-            GroupMember.user_id != current_user.id,
-            GroupMember.is_active == True
-        ).count()
-        
-        if other_members > 0:
+        # EXISTS stops at the first other member instead of counting them all
+        has_other_members = await db.scalar(
+            select(exists().where(
+                GroupMember.group_id == group_id,
+                GroupMember.user_id != current_user.id,
+                GroupMember.is_active == True
+            ))
+        )
+
+        if has_other_members:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Group creator cannot leave while other members exist"
             )
     
     # Remove user from group
-    member.is_active = False
-    db.commit()
-    
+    member.status = MemberStatus.INACTIVE
+    await db.commit()
+    invalidate_membership(current_user.id, group_id)
+
     return {"message": "Successfully left the group"}
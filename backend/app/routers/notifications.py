@@ -0,0 +1,195 @@
+from string import Template
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import case, delete, desc, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.cache import TTLCache
+from app.database import get_async_db
+from app.models import Notification, User
+from app.auth import get_current_user
+
+router = APIRouter()
+
+# The unread badge is polled every few seconds per user; a short TTL plus
+# write-through invalidation keeps those polls off the database. Keyed by
+# user id, per-process by design.
+_unread_cache = TTLCache()
+_UNREAD_TTL = 15.0
+
+# Notification templates. string.Template parses the placeholder syntax
+# once at import, so rendering during a fan-out is a plain substitution
+# instead of re-running the format mini-language per recipient.
+NOTIFICATION_TEMPLATES = {
+    "contribution_received": {
+        "title": "Contribution received",
+        "message": "Your contribution of $amount to $group_name has been received.",
+    },
+    "contribution_due": {
+        "title": "Contribution due",
+        "message": "Your contribution of $amount to $group_name is due on $due_date.",
+    },
+    "cycle_completed": {
+        "title": "Cycle completed",
+        "message": "Cycle $cycle_number of $group_name is complete and the payout went to $recipient_name.",
+    },
+    "payout_sent": {
+        "title": "Payout sent",
+        "message": "Your payout of $amount from $group_name has been sent to your wallet.",
+    },
+    "member_joined": {
+        "title": "New member",
+        "message": "$member_name joined $group_name.",
+    },
+}
+
+_COMPILED_TEMPLATES = {
+    key: (template["title"], Template(template["message"]))
+    for key, template in NOTIFICATION_TEMPLATES.items()
+}
+
+def render_notification(key: str, **kwargs) -> dict:
+    """Render a notification template into insertable column values"""
+    title, message = _COMPILED_TEMPLATES[key]
+    return {"title": title, "message": message.substitute(**kwargs), "type": key}
+
+async def create_notifications_bulk(rows: list, db: AsyncSession) -> int:
+    """Insert many notifications with one multi-row INSERT.
+
+    For fan-outs (a cycle completing, a member joining) this issues a
+    single executemany statement and one commit instead of one
+    add()+commit() per recipient, then drops each recipient's cached
+    unread count.
+    """
+    if not rows:
+        return 0
+
+    await db.execute(insert(Notification), rows)
+    await db.commit()
+    for row in rows:
+        _unread_cache.invalidate(row["user_id"])
+    return len(rows)
+
+def _notification_dict(notification: Notification) -> dict:
+    return {
+        "id": notification.id,
+        "title": notification.title,
+        "message": notification.message,
+        "type": notification.type,
+        "is_read": notification.is_read,
+        "created_at": notification.created_at,
+    }
+
+@router.get("/")
+async def get_notifications(
+    skip: int = 0,
+    limit: int = 50,
+    unread_only: bool = False,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get the current user's notifications with total and unread counts"""
+    # The counts ride along as window aggregates, so one query returns the
+    # page plus both totals instead of three sequential round-trips
+    stmt = select(
+        Notification,
+        func.count().over().label("total"),
+        func.sum(case((Notification.is_read == False, 1), else_=0)).over().label("unread")
+    ).where(Notification.user_id == current_user.id)
+
+    if unread_only:
+        stmt = stmt.where(Notification.is_read == False)
+
+    rows = (await db.execute(
+        stmt.order_by(desc(Notification.created_at)).offset(skip).limit(limit)
+    )).all()
+
+    return {
+        "total": rows[0].total if rows else 0,
+        "unread": rows[0].unread if rows else 0,
+        "notifications": [_notification_dict(row[0]) for row in rows],
+    }
+
+@router.get("/unread-count")
+async def get_unread_count(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get the current user's unread notification count"""
+    count = _unread_cache.get(current_user.id)
+    if count is None:
+        count = await db.scalar(
+            select(func.count(Notification.id)).where(
+                Notification.user_id == current_user.id,
+                Notification.is_read == False
+            )
+        )
+        _unread_cache.set(current_user.id, count, _UNREAD_TTL)
+
+    return {"unread_count": count}
+
+@router.put("/read-all")
+async def mark_all_notifications_read(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Mark all of the current user's notifications as read"""
+    result = await db.execute(
+        update(Notification).where(
+            Notification.user_id == current_user.id,
+            Notification.is_read == False
+        ).values(is_read=True)
+    )
+    await db.commit()
+    _unread_cache.invalidate(current_user.id)
+
+    return {"message": "All notifications marked as read", "updated": result.rowcount}
+
+@router.put("/{notification_id}/read")
+async def mark_notification_read(
+    notification_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Mark one notification as read"""
+    # Single UPDATE with ownership in the predicate - no SELECT, no ORM
+    # hydration; rowcount doubles as the existence check
+    result = await db.execute(
+        update(Notification).where(
+            Notification.id == notification_id,
+            Notification.user_id == current_user.id
+        ).values(is_read=True)
+    )
+    if result.rowcount == 0:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Notification not found"
+        )
+    await db.commit()
+    _unread_cache.invalidate(current_user.id)
+
+    return {"message": "Notification marked as read"}
+
+@router.delete("/{notification_id}")
+async def delete_notification(
+    notification_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Delete one notification"""
+    result = await db.execute(
+        delete(Notification).where(
+            Notification.id == notification_id,
+            Notification.user_id == current_user.id
+        )
+    )
+    if result.rowcount == 0:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Notification not found"
+        )
+    await db.commit()
+    _unread_cache.invalidate(current_user.id)
+
+    return {"message": "Notification deleted"}
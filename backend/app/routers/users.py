@@ -1,72 +1,98 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from datetime import datetime, timezone
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Dict
-from app.database import get_db
-from app.models import User, GroupMember
-from app.schemas import UserCreate, UserResponse, UserLogin
-from app.auth import get_password_hash, verify_password, create_access_token, get_current_user
+from app.database import get_async_db
+from app.models import User, UserStatus, GroupMember
+from app.schemas import UserCreate, UserResponse, UserResponseList, UserLogin
+from app.auth import (
+    create_access_token,
+    get_current_user,
+    get_password_hash_async,
+    password_needs_rehash,
+    verify_password_async,
+)
+from app.permissions import get_user_dashboard_config
 
 router = APIRouter()
 
 @router.post("/register", response_model=UserResponse)
-async def register_user(user: UserCreate, db: Session = Depends(get_db)):
+async def register_user(user: UserCreate, db: AsyncSession = Depends(get_async_db)):
     """Register a new user"""
-    # Check if user already exists
-    db_user = db.query(User).filter(
-        (User.email == user.email) | (User.username == user.username)
-    ).first()
-    
+    # The schema validator already lowercased the email, so the duplicate
+    # check compares against exactly what would be written
+    email = user.email
+    db_user = await db.scalar(select(User).where(
+        (User.email == email) | (User.username == user.username)
+    ))
+
     if db_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email or username already registered"
         )
     
-    # Handle wallet address
-    wallet_address = user.wallet_address if user.wallet_address and user.wallet_address.strip() else None
-    
-    # Create new user
-    hashed_password = get_password_hash(user.password)
+    # Create new user - hashing runs in a worker thread, off the event loop
+    hashed_password = await get_password_hash_async(user.password)
     db_user = User(
         username=user.username,
-        email=user.email,
+        email=email,
         full_name=user.full_name,
         phone_number=user.phone_number,
-        wallet_address=wallet_address,
+        # The schema validator already mapped blank input to None
+        wallet_address=user.wallet_address,
         hashed_password=hashed_password
     )
     
     try:
         db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        await db.commit()
+        await db.refresh(db_user)
         return db_user
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred while registering the user"
         )
 
 @router.post("/login")
-async def login_user(user_credentials: UserLogin, db: Session = Depends(get_db)):
+async def login_user(user_credentials: UserLogin, db: AsyncSession = Depends(get_async_db)):
     """Authenticate user and return access token"""
-    user = db.query(User).filter(User.email == user_credentials.email).first()
-    
-    if not user or not verify_password(user_credentials.password, user.hashed_password):
+    # Only the columns the credential check needs leave the database; the
+    # full profile is hydrated once, and only for successful logins
+    row = (await db.execute(
+        select(User.id, User.email, User.hashed_password, User.status).where(
+            User.email == user_credentials.email
+        )
+    )).first()
+
+    if not row or not await verify_password_async(user_credentials.password, row.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password"
         )
-    
-    if not user.is_active:
+
+    if row.status != UserStatus.ACTIVE:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User account is deactivated"
         )
-    
-    access_token = create_access_token(data={"sub": user.email})
-    
+
+    # Transparently migrate bcrypt (or stale-parameter) hashes to argon2id
+    # now that we hold the verified plaintext
+    if password_needs_rehash(row.hashed_password):
+        await db.execute(
+            update(User).where(User.id == row.id).values(
+                hashed_password=await get_password_hash_async(user_credentials.password)
+            )
+        )
+        await db.commit()
+
+    access_token = create_access_token(data={"sub": row.email})
+    user = await db.get(User, row.id)
+
     return {
         "access_token": access_token,
         "token_type": "bearer",
@@ -74,32 +100,57 @@ async def login_user(user_credentials: UserLogin, db: Session = Depends(get_db))
     }
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_profile(current_user: User = Depends(get_current_user)):
+async def get_current_user_profile(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
     """Get current user profile"""
+    # Record activity at most once a minute with a targeted UPDATE whose
+    # timestamp the database computes - polling /me doesn't write per call
+    last_login = current_user.last_login
+    if last_login is not None and last_login.tzinfo is None:
+        last_login = last_login.replace(tzinfo=timezone.utc)
+    if last_login is None or (datetime.now(timezone.utc) - last_login).total_seconds() > 60:
+        await db.execute(
+            update(User).where(User.id == current_user.id).values(last_login=func.now())
+        )
+        await db.commit()
+
     return current_user
 
-@router.get("/", response_model=List[UserResponse])
-async def get_users(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+@router.get("/me/dashboard")
+async def get_my_dashboard_config(current_user: User = Depends(get_current_user)):
+    """Get the role-based dashboard configuration for the current user"""
+    # Served from the warmed per-role cache in app.permissions - no DB work
+    return get_user_dashboard_config(current_user.role)
+
+@router.get("/")
+async def get_users(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_async_db)):
     """Get list of users"""
-    users = db.query(User).offset(skip).limit(limit).all()
-    return [UserResponse.from_orm(user) for user in users]
+    users = (await db.scalars(select(User).offset(skip).limit(limit))).all()
+    # Validate once, then dump_json writes the UTF-8 body in the same
+    # pydantic-core pass - no dict materialization, no second encoder
+    return Response(
+        content=UserResponseList.dump_json(UserResponseList.validate_python(users)),
+        media_type="application/json",
+    )
 
 @router.get("/{user_id}", response_model=UserResponse)
-async def get_user(user_id: int, db: Session = Depends(get_db)):
+async def get_user(user_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get user by ID"""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
-    return UserResponse.from_orm(user)
+    return UserResponse.model_validate(user)
 
 @router.put("/{user_id}/wallet")
 async def update_wallet_address(
-    user_id: int, 
-    wallet_address: str, 
-    db: Session = Depends(get_db),
+    user_id: int,
+    wallet_address: str,
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Update user's wallet address"""
@@ -108,8 +159,8 @@ async def update_wallet_address(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Can only update your own wallet address"
         )
-    
+
     current_user.wallet_address = wallet_address
-    db.commit()
+    await db.commit()
     
     return {"message": "Wallet address updated successfully"}
@@ -1,121 +1,289 @@
-from pydantic import BaseModel, EmailStr
-from typing import Optional, List
+import re
+
+import enum
+
+from pydantic import BaseModel, BeforeValidator, ConfigDict, PlainSerializer, TypeAdapter, field_validator
+from typing import Annotated, Any, Literal, List
 from datetime import datetime
+from decimal import Decimal
+
+def _enum_value(value):
+    # ORM rows hand back enum members; unwrap to the stored string so the
+    # Literal fast path sees a plain value either way
+    return value.value if isinstance(value, enum.Enum) else value
+
+_EnumValue = BeforeValidator(_enum_value)
+
+# Closed vocabularies mirroring the models.py enums: Literal collapses
+# validation to a small switch instead of accepting any string, and the
+# OpenAPI schema documents the legal values for free
+ContributionFrequency = Literal["weekly", "monthly"]
+CycleStatus = Annotated[Literal["active", "completed", "cancelled"], _EnumValue]
+ContributionStatus = Annotated[Literal["pending", "confirmed", "failed", "late"], _EnumValue]
+
+def _to_epoch(value):
+    # ORM attributes arrive as datetime; clients send the integer directly
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    return value
+
+# Timestamps ride the wire as Unix epoch seconds: integer validation is a
+# fraction of the cost of pydantic-core's ISO-8601 parse/format on the
+# many-row listing endpoints, and clients get a tz-unambiguous number
+EpochSeconds = Annotated[int, BeforeValidator(_to_epoch)]
+
+# Money amounts validate into Decimal so values reach the Numeric(38, 18)
+# columns exactly as sent, with no float rounding on the write path; they
+# serialize back to float so the JSON wire format is unchanged
+Money = Annotated[Decimal, PlainSerializer(float, return_type=float)]
+
+# Precompiled shape check used instead of EmailStr: it avoids pulling in
+# email-validator (IDNA tables and all) on every request thread, and the
+# register path lowercases/strips before the unique-index lookup anyway
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# 0x + 40 hex chars, compiled once; checksum casing is advisory, so the
+# canonical lowercase form is returned (matching what the User model stores)
+_ETH_ADDRESS_RE = re.compile(r"^0x[0-9a-fA-F]{40}$")
+
+def _check_eth_address(value: str | None) -> str | None:
+    # An empty or whitespace-only string means "no wallet" - forms submit
+    # untouched blank fields as '' - and maps to NULL like a missing field
+    if value is None or not value.strip():
+        return None
+    if not _ETH_ADDRESS_RE.match(value):
+        raise ValueError("value is not a valid Ethereum address")
+    return value.lower()
 
-# Base configuration for ORM models
+def _check_email(value: str) -> str:
+    value = value.strip().lower()
+    if not _EMAIL_RE.match(value):
+        raise ValueError("value is not a valid email address")
+    return value
+
+# Base configuration for ORM models. ConfigDict is the pydantic v2 API -
+# the v1-style inner Config only works through a deprecation shim
 class ORMModel(BaseModel):
-    class Config:
-        orm_mode = True
+    # validate_default=False skips re-validating the literal None/0
+    # defaults on every construction; they are known-good constants
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        validate_default=False,
+    )
+
+# Shared config singletons: pydantic caches parts of the schema build on
+# config identity, so every request/response model points at the same two
+# objects instead of declaring N equivalent copies
+_REQUEST_CONFIG = ConfigDict(extra="forbid")
+_RESPONSE_CONFIG = ConfigDict(frozen=True)
 
 # User Schemas
 class UserBase(ORMModel):
     username: str
-    email: EmailStr
-    full_name: Optional[str] = None
-    phone_number: Optional[str] = None
-    wallet_address: Optional[str] = None
+    email: str
+    full_name: str | None = None
+    phone_number: str | None = None
+    wallet_address: str | None = None
+
+    _normalize_email = field_validator("email")(_check_email)
+    _normalize_wallet = field_validator("wallet_address")(_check_eth_address)
 
+# Request models reject unknown keys outright: a typoed field fails fast
+# at the edge instead of being silently dropped. Response models are
+# frozen so instances hash/share safely; model_copy(update=...) still
+# works for computed fields like member_count
 class UserCreate(UserBase):
+    model_config = _REQUEST_CONFIG
+
     password: str
 
 class UserLogin(ORMModel):
-    email: EmailStr
+    model_config = _REQUEST_CONFIG
+
+    email: str
     password: str
 
+    _normalize_email = field_validator("email")(_check_email)
+
 class UserResponse(UserBase):
+    model_config = _RESPONSE_CONFIG
+
     id: int
     is_active: bool
-    created_at: datetime
+    created_at: EpochSeconds
+
+# Trimmed projection for embedding in listings: enough to render a
+# member row, a fraction of the fields (and bytes) of full UserResponse
+class UserResponseBrief(ORMModel):
+    model_config = _RESPONSE_CONFIG
+
+    id: int
+    username: str
+    full_name: str | None = None
 
 # Group Schemas
 class GroupBase(ORMModel):
     name: str
-    description: Optional[str] = None
-    contribution_amount: float
-    contribution_frequency: str
+    description: str | None = None
+    contribution_amount: Money
+    contribution_frequency: ContributionFrequency
     max_members: int
 
 class GroupCreate(GroupBase):
-    pass
+    model_config = _REQUEST_CONFIG
 
 class GroupResponse(GroupBase):
+    model_config = _RESPONSE_CONFIG
+
     id: int
     creator_id: int
-    contract_address: Optional[str] = None
+    contract_address: str | None = None
     is_active: bool
-    created_at: datetime
-    member_count: Optional[int] = 0
+    created_at: EpochSeconds
+    member_count: int | None = 0
 
 # Cycle Schemas
-class CycleBase(BaseModel):
+class CycleBase(ORMModel):
     cycle_number: int
-    start_date: datetime
-    end_date: datetime
+    start_date: EpochSeconds
+    end_date: EpochSeconds
 
 class CycleCreate(CycleBase):
+    model_config = _REQUEST_CONFIG
+
     group_id: int
     recipient_id: int
 
 class CycleResponse(CycleBase):
+    model_config = _RESPONSE_CONFIG
+
     id: int
     group_id: int
     recipient_id: int
-    total_amount: Optional[float] = None
-    payout_amount: Optional[float] = None
-    status: str
-    transaction_hash: Optional[str] = None
-    
-    class Config:
-        orm_mode = True
+    total_amount: Money | None = None
+    payout_amount: Money | None = None
+    status: CycleStatus
+    transaction_hash: str | None = None
 
 # Contribution Schemas
-class ContributionBase(BaseModel):
-    amount: float
+class ContributionBase(ORMModel):
+    amount: Money
 
 class ContributionCreate(ContributionBase):
+    model_config = _REQUEST_CONFIG
+
     cycle_id: int
 
 class ContributionResponse(ContributionBase):
+    model_config = _RESPONSE_CONFIG
+
     id: int
     cycle_id: int
     user_id: int
-    transaction_hash: Optional[str] = None
-    contribution_date: datetime
-    status: str
-    
-    class Config:
-        orm_mode = True
+    transaction_hash: str | None = None
+    contribution_date: EpochSeconds
+    status: ContributionStatus
 
 # Group Member Schemas
-class GroupMemberResponse(BaseModel):
+class GroupMemberResponse(ORMModel):
+    model_config = _RESPONSE_CONFIG
+
     id: int
     user_id: int
     group_id: int
-    join_date: datetime
+    join_date: EpochSeconds
     is_active: bool
-    rotation_order: Optional[int] = None
-    user: UserResponse
-    
-    class Config:
-        orm_mode = True
+    rotation_order: int | None = None
+    user: UserResponseBrief
+
+# Admin Schemas
+class BroadcastNotificationRequest(ORMModel):
+    model_config = _REQUEST_CONFIG
+
+    title: str
+    message: str
+    type: str = "system_alert"
+    target: Literal["all", "role"] = "all"
+    target_role: str | None = None
+
+class SystemSettingUpdate(ORMModel):
+    model_config = _REQUEST_CONFIG
+
+    # Settings are stored in a JSON column, so any JSON value is legal -
+    # but the key must be present
+    value: Any
 
 # Blockchain Schemas
 class ContractDeployRequest(ORMModel):
+    model_config = _REQUEST_CONFIG
+
     group_id: int
 
 class ContractDeployResponse(ORMModel):
+    model_config = _RESPONSE_CONFIG
+
     group_id: int
     contract_address: str
     transaction_hash: str
 
 class TransactionRequest(ORMModel):
+    model_config = _REQUEST_CONFIG
+
     group_id: int
-    amount: float
+    amount: Money
     recipient_address: str
 
+    _check_recipient = field_validator("recipient_address")(_check_eth_address)
+
 class TransactionResponse(ORMModel):
+    model_config = _RESPONSE_CONFIG
+
     transaction_hash: str
     status: str
-    amount: float
+    amount: Money
     sender_address: str
     recipient_address: str
+
+# Module-level list adapters: validating a page of ORM rows in one
+# pydantic-core call replaces a per-element from_orm Python loop
+UserResponseList = TypeAdapter(List[UserResponse])
+GroupResponseList = TypeAdapter(List[GroupResponse])
+GroupMemberResponseList = TypeAdapter(List[GroupMemberResponse])
+CycleResponseList = TypeAdapter(List[CycleResponse])
+ContributionResponseList = TypeAdapter(List[ContributionResponse])
+
+__all__ = [
+    "ContributionFrequency",
+    "ContributionStatus",
+    "CycleStatus",
+    "EpochSeconds",
+    "Money",
+    "ORMModel",
+    "UserBase",
+    "UserCreate",
+    "UserLogin",
+    "UserResponse",
+    "UserResponseBrief",
+    "GroupBase",
+    "GroupCreate",
+    "GroupResponse",
+    "CycleBase",
+    "CycleCreate",
+    "CycleResponse",
+    "ContributionBase",
+    "ContributionCreate",
+    "ContributionResponse",
+    "GroupMemberResponse",
+    "BroadcastNotificationRequest",
+    "SystemSettingUpdate",
+    "ContractDeployRequest",
+    "ContractDeployResponse",
+    "TransactionRequest",
+    "TransactionResponse",
+    "UserResponseList",
+    "GroupResponseList",
+    "GroupMemberResponseList",
+    "CycleResponseList",
+    "ContributionResponseList",
+]
@@ -46,7 +46,9 @@ const Register = () => {
     }
 
     try {
-      await register(formData);
+      // confirmPassword is a form-only field; the API rejects unknown keys
+      const { confirmPassword, ...payload } = formData;
+      await register(payload);
       toast.success('Registration successful! Please login.');
       navigate('/login');
     } catch (error) {